@@ -5,21 +5,155 @@ class ConsensusAlgorithm:
     Implements a consensus algorithm for drone swarms.
     The algorithm ensures that drones move towards the average position of their neighbors,
     promoting cohesion within the swarm.
+
+    In 'flat' mode every drone averages the positions of all the other drones, which costs
+    O(N^2) per step. In 'hierarchical' mode drones are grouped into spatial clusters, cluster
+    centroids are aggregated level by level up to the whole swarm, and the result is pushed
+    back down to the drones, which keeps the per-step communication close to O(N).
     """
 
-    def __init__(self, epsilon):
+    def __init__(self, epsilon, mode="flat", cluster_size=32, rebuild_interval=10):
         """
         Initializes the consensus algorithm.
 
         Parameters:
-        - epsilon (float): Convergence rate factor that determines how strongly 
+        - epsilon (float): Convergence rate factor that determines how strongly
                            the drone moves towards the average neighbor position.
+        - mode (str): 'flat' or 'hierarchical'.
+        - cluster_size (int): Number of members per cluster in hierarchical mode.
+        - rebuild_interval (int): Number of steps between two rebuilds of the clusters.
         """
+        if mode == "hierarchical" and cluster_size < 2:
+            raise ValueError("cluster_size must be at least 2 in hierarchical mode")
+
         self.epsilon = epsilon
+        self.mode = mode
+        self.cluster_size = cluster_size
+        self.rebuild_interval = rebuild_interval
+
+        # Hierarchical mode state
+        self.levels = None  # Cluster labels of the nodes of each level, from the drones upwards
+        self.rows = {}  # Row of each drone index in the position arrays
+        self.steps_since_rebuild = 0
+        self.targets = None
+        self.message_count = 0  # Messages exchanged during the last hierarchical step
+
+    def prepare(self, drones):
+        """
+        Aggregates the swarm through the cluster hierarchy once per simulation step.
+        Does nothing in flat mode.
+
+        Parameters:
+        - drones (list of Drone): List of drone objects in the swarm.
+        """
+        if self.mode != "hierarchical":
+            return
+
+        positions = np.array([drone.get_position() for drone in drones], dtype=float)
+
+        if self.levels is None or len(self.rows) != len(drones) or self.steps_since_rebuild >= self.rebuild_interval:
+            self.build_clusters(positions)
+            self.rows = {drone.index: row for row, drone in enumerate(drones)}
+
+        self.steps_since_rebuild += 1
+        self.targets = self.aggregate(positions)
+
+    def build_clusters(self, positions):
+        """
+        Groups the drones into spatial clusters, then the clusters into coarser clusters,
+        until a single level holds at most cluster_size nodes.
+
+        Parameters:
+        - positions (numpy array): Positions of the drones, shape (N, 3).
+        """
+        self.levels = []
+        points = positions
+        while len(points) > self.cluster_size:
+            # Consecutive nodes along a Z-order curve are spatially close
+            order = np.argsort(self._morton_codes(points), kind='stable')
+            labels = np.empty(len(points), dtype=int)
+            labels[order] = np.arange(len(points)) // self.cluster_size
+
+            self.levels.append(labels)
+            points, _ = self._centroids(points, np.ones(len(points)), labels)
+
+        self.steps_since_rebuild = 0
+
+    def aggregate(self, positions):
+        """
+        Computes the consensus target of every drone through the cluster hierarchy.
+
+        Each node reports its centroid to its parent cluster (upward pass). The top level
+        computes the swarm centroid, and every parent sends its children the offset from their
+        centroid to the swarm centroid (downward pass).
+
+        Parameters:
+        - positions (numpy array): Positions of the drones, shape (N, 3).
+
+        Returns:
+        - targets (numpy array): Position each drone moves towards, shape (N, 3).
+        """
+        # Upward pass: centroids and drone counts of every level
+        centroids = [positions]
+        counts = [np.ones(len(positions))]
+        for labels in self.levels:
+            level_centroids, level_counts = self._centroids(centroids[-1], counts[-1], labels)
+            centroids.append(level_centroids)
+            counts.append(level_counts)
+
+        swarm_centroid = np.average(centroids[-1], axis=0, weights=counts[-1])
+
+        # Downward pass: each node receives the offset to the swarm centroid from its parent
+        offsets = swarm_centroid - centroids[-1]
+        for level in range(len(self.levels) - 1, -1, -1):
+            labels = self.levels[level]
+            offsets = offsets[labels] + centroids[level + 1][labels] - centroids[level]
+
+        # Every node reports to its parent and receives its offset back
+        self.message_count = 2 * sum(len(level_centroids) for level_centroids in centroids)
+        return positions + offsets
+
+    def _centroids(self, points, weights, labels):
+        """
+        Computes the weighted centroid of each cluster.
+
+        Parameters:
+        - points (numpy array): Positions of the nodes, shape (M, 3).
+        - weights (numpy array): Number of drones represented by each node.
+        - labels (numpy array): Cluster of each node.
+
+        Returns:
+        - centroids (numpy array): Centroid of each cluster.
+        - counts (numpy array): Number of drones in each cluster.
+        """
+        counts = np.bincount(labels, weights=weights)
+        sums = np.column_stack([np.bincount(labels, weights=points[:, axis] * weights) for axis in range(3)])
+        return sums / counts[:, None], counts
+
+    def _morton_codes(self, points):
+        """
+        Computes the Z-order (Morton) code of each point, with 21 bits per axis.
+
+        Parameters:
+        - points (numpy array): Positions, shape (M, 3).
+
+        Returns:
+        - codes (numpy array): Morton code of each point.
+        """
+        low = points.min(axis=0)
+        extent = np.maximum(points.max(axis=0) - low, 1e-9)
+        cells = ((points - low) / extent * (2 ** 21 - 1)).astype(np.uint64)
+
+        # Spread the 21 bits of each coordinate so that they can be interleaved
+        for shift, mask in ((32, 0x1F00000000FFFF), (16, 0x1F0000FF0000FF), (8, 0x100F00F00F00F00F),
+                            (4, 0x10C30C30C30C30C3), (2, 0x1249249249249249)):
+            cells = (cells | (cells << np.uint64(shift))) & np.uint64(mask)
+
+        return cells[:, 0] | (cells[:, 1] << np.uint64(1)) | (cells[:, 2] << np.uint64(2))
 
     def apply(self, drone, neighbor_positions, current_position):
         """
-        Applies the consensus algorithm to adjust the drone's position based on 
+        Applies the consensus algorithm to adjust the drone's position based on
         the average position of its neighbors.
 
         Parameters:
@@ -30,8 +164,12 @@ class ConsensusAlgorithm:
         Returns:
         - new_position (numpy array): The updated position after applying the consensus algorithm.
         """
-        # Compute the mean position of all neighboring drones
-        mean_neighbor_position = np.mean(neighbor_positions, axis=0)
+        if self.mode == "hierarchical" and self.targets is not None and drone.index in self.rows:
+            # Consensus target aggregated through the cluster hierarchy by prepare()
+            mean_neighbor_position = self.targets[self.rows[drone.index]]
+        else:
+            # Compute the mean position of all neighboring drones
+            mean_neighbor_position = np.mean(neighbor_positions, axis=0)
 
         # Update the position by moving towards the mean neighbor position
         new_position = current_position + self.epsilon * (mean_neighbor_position - current_position)
@@ -1,5 +1,7 @@
 import numpy as np
 
+from behaviors.slot_assignment_algorithm import SlotAssignmentAlgorithm
+
 class FormationControlAlgorithm:
     """
     Implements different formation control strategies for drone swarms.
@@ -16,6 +18,11 @@ class FormationControlAlgorithm:
         self.formation_type = formation_type
         self.target_point = np.array([0, 0, 0])  # Initial target point for the formation
 
+        # Slot assigned to each drone index, cached until the formation or target point changes
+        self.slot_assignment_algorithm = SlotAssignmentAlgorithm()
+        self.slots = {}
+        self._slots_key = None
+
     def set_target_point(self, target_point):
         """
         Sets the target point for the formation.
@@ -25,6 +32,70 @@ class FormationControlAlgorithm:
         """
         self.target_point = target_point
 
+    def assign_slots(self, drones):
+        """
+        Assigns each drone to the formation slot that minimizes the total travel distance.
+        The result is cached until the formation type, target point or swarm size changes.
+
+        Parameters:
+        - drones (list of Drone): List of drone objects in the swarm.
+        """
+        key = (self.formation_type, tuple(np.asarray(self.target_point, dtype=float)), len(drones))
+        if key == self._slots_key:
+            return
+
+        slot_positions = self.get_slot_positions(len(drones))
+        if slot_positions is None:
+            # Random or unknown formations have no fixed slots, keep the index order
+            self.slots = {}
+        else:
+            drone_positions = np.array([drone.get_position() for drone in drones])
+            assignment = self.slot_assignment_algorithm.assign(drone_positions, slot_positions + self.target_point)
+            self.slots = {drone.index: int(slot) for drone, slot in zip(drones, assignment)}
+
+        self._slots_key = key
+
+    def get_slot(self, drone):
+        """
+        Returns the formation slot assigned to a drone.
+
+        Parameters:
+        - drone (Drone): The drone object.
+
+        Returns:
+        - slot (int): The assigned slot, or the drone's index if no assignment was made.
+        """
+        return self.slots.get(drone.index, drone.index)
+
+    def get_slot_positions(self, num_drones):
+        """
+        Returns the slot positions used by apply(), relative to the target point.
+
+        Parameters:
+        - num_drones (int): Number of drones in the swarm.
+
+        Returns:
+        - slot_positions (numpy array or None): Slot positions, or None for formations without fixed slots.
+        """
+        slots = np.arange(num_drones)
+        if self.formation_type == "line":
+            x = np.linspace(0, 10, num_drones)
+            return np.column_stack([x, np.full(num_drones, 5.0), np.full(num_drones, 5.0)])
+        elif self.formation_type == "circle":
+            # Same angle step as _circle_formation, which divides by the number of neighbors
+            angle = 2 * np.pi * slots / max(num_drones - 1, 1)
+            return np.column_stack([10 * np.cos(angle) + 5.0, 10 * np.sin(angle) + 5.0, np.full(num_drones, 5.0)])
+        elif self.formation_type == "square":
+            side_length = int(np.ceil(np.sqrt(num_drones)))
+            spacing = 2
+            center_offset = (side_length - 1) * spacing / 2
+            return np.column_stack([
+                (slots % side_length) * spacing + 5.0 - center_offset,
+                (slots // side_length) * spacing + 5.0 - center_offset,
+                np.full(num_drones, 5.0)
+            ])
+        return None
+
     def apply(self, drone, neighbor_positions, current_position):
         """
         Applies the selected formation control strategy to adjust the drone's position.
@@ -148,8 +219,8 @@ class FormationControlAlgorithm:
         # Dynamically determine the target positions along a straight line
         target_positions = np.linspace(0, line_length, len(neighbor_positions) + 1)
 
-        # Set the target position based on the drone's index, centering the line at (5,5)
-        target_position = np.array([target_positions[drone.index], 5.0, 5.0])
+        # Set the target position based on the drone's slot, centering the line at (5,5)
+        target_position = np.array([target_positions[self.get_slot(drone)], 5.0, 5.0])
 
         return target_position
 
@@ -165,7 +236,7 @@ class FormationControlAlgorithm:
         - target_position (numpy array): The computed position for the circular formation.
         """
         # Compute the angle for each drone in the circle
-        angle = 2 * np.pi * drone.index / len(neighbor_positions)
+        angle = 2 * np.pi * self.get_slot(drone) / len(neighbor_positions)
         radius = 10  # Radius of the circle
 
         # Compute the target position for circular formation, centering at (5,5)
@@ -191,8 +262,9 @@ class FormationControlAlgorithm:
         num_drones = len(neighbor_positions) + 1
         side_length = int(np.ceil(np.sqrt(num_drones)))  # Define the grid size
 
-        row = drone.index // side_length
-        col = drone.index % side_length
+        slot = self.get_slot(drone)
+        row = slot // side_length
+        col = slot % side_length
 
         spacing = 2  # Adjust spacing between drones
         center_offset = (side_length - 1) * spacing / 2
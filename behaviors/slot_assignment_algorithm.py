@@ -0,0 +1,140 @@
+import numpy as np
+
+class SlotAssignmentAlgorithm:
+    """
+    Assigns drones to formation slots so that the total travel distance is minimized.
+    Small swarms are solved exactly with the Hungarian algorithm, larger swarms use a
+    spatially sorted approximation refined block by block with the exact solver.
+    """
+
+    def __init__(self, exact_threshold=256, block_size=32):
+        """
+        Initializes the slot assignment algorithm.
+
+        Parameters:
+        - exact_threshold (int): Largest swarm size solved with the exact algorithm.
+        - block_size (int): Number of consecutive sorted drones refined together
+                            by the exact algorithm when approximating.
+        """
+        self.exact_threshold = exact_threshold
+        self.block_size = block_size
+
+    def assign(self, drone_positions, slot_positions):
+        """
+        Computes which slot each drone should fly to.
+
+        Parameters:
+        - drone_positions (numpy array): Current positions of the drones, shape (N, 3).
+        - slot_positions (numpy array): Absolute positions of the formation slots, shape (N, 3).
+
+        Returns:
+        - assignment (numpy array): Slot index assigned to each drone.
+        """
+        drone_positions = np.asarray(drone_positions, dtype=float)
+        slot_positions = np.asarray(slot_positions, dtype=float)
+
+        if len(drone_positions) <= self.exact_threshold:
+            return self._solve_exact(self._travel_costs(drone_positions, slot_positions))
+
+        return self._solve_sorted(drone_positions, slot_positions)
+
+    def _travel_costs(self, drone_positions, slot_positions):
+        """
+        Computes the distance between every drone and every slot.
+
+        Parameters:
+        - drone_positions (numpy array): Positions of the drones, shape (N, 3).
+        - slot_positions (numpy array): Positions of the slots, shape (N, 3).
+
+        Returns:
+        - costs (numpy array): Distance matrix of shape (N, N).
+        """
+        return np.linalg.norm(drone_positions[:, None, :] - slot_positions[None, :, :], axis=2)
+
+    def _solve_exact(self, costs):
+        """
+        Solves the assignment problem exactly with the Hungarian algorithm (O(N^3)).
+
+        Parameters:
+        - costs (numpy array): Square cost matrix, costs[i, j] is the cost of drone i taking slot j.
+
+        Returns:
+        - assignment (numpy array): Slot index assigned to each drone.
+        """
+        num_drones = len(costs)
+
+        # Potentials and matching use 1-based indices, column 0 is a virtual free column
+        u = np.zeros(num_drones + 1)
+        v = np.zeros(num_drones + 1)
+        match = np.zeros(num_drones + 1, dtype=int)  # match[j]: drone holding slot j
+        way = np.zeros(num_drones + 1, dtype=int)
+
+        for i in range(1, num_drones + 1):
+            match[0] = i
+            j0 = 0
+            min_slack = np.full(num_drones + 1, np.inf)
+            used = np.zeros(num_drones + 1, dtype=bool)
+
+            # Grow an alternating tree until a free slot is reached
+            while True:
+                used[j0] = True
+                i0 = match[j0]
+                slack = costs[i0 - 1] - u[i0] - v[1:]
+                free = ~used[1:]
+
+                improved = free & (slack < min_slack[1:])
+                min_slack[1:][improved] = slack[improved]
+                way[1:][improved] = j0
+
+                candidates = np.where(free, min_slack[1:], np.inf)
+                j1 = int(np.argmin(candidates)) + 1
+                delta = candidates[j1 - 1]
+
+                u[match[used]] += delta
+                v[used] -= delta
+                min_slack[1:][free] -= delta
+
+                j0 = j1
+                if match[j0] == 0:
+                    break
+
+            # Flip the augmenting path
+            while j0 != 0:
+                j1 = way[j0]
+                match[j0] = match[j1]
+                j0 = j1
+
+        assignment = np.empty(num_drones, dtype=int)
+        assignment[match[1:] - 1] = np.arange(num_drones)
+        return assignment
+
+    def _solve_sorted(self, drone_positions, slot_positions):
+        """
+        Approximates the assignment for large swarms in O(N log N + N * block_size^2).
+
+        Drones and slots are sorted along the principal axis of the formation and paired
+        by rank, then each block of consecutive pairs is re-solved exactly.
+
+        Parameters:
+        - drone_positions (numpy array): Positions of the drones, shape (N, 3).
+        - slot_positions (numpy array): Positions of the slots, shape (N, 3).
+
+        Returns:
+        - assignment (numpy array): Slot index assigned to each drone.
+        """
+        # The principal axis of the slots is the direction along which the formation spreads most
+        centered_slots = slot_positions - slot_positions.mean(axis=0)
+        _, _, axes = np.linalg.svd(centered_slots, full_matrices=False)
+        axis = axes[0]
+
+        drone_order = np.argsort(drone_positions @ axis, kind='stable')
+        slot_order = np.argsort(slot_positions @ axis, kind='stable')
+
+        assignment = np.empty(len(drone_positions), dtype=int)
+        for start in range(0, len(drone_order), self.block_size):
+            block_drones = drone_order[start:start + self.block_size]
+            block_slots = slot_order[start:start + self.block_size]
+            costs = self._travel_costs(drone_positions[block_drones], slot_positions[block_slots])
+            assignment[block_drones] = block_slots[self._solve_exact(costs)]
+
+        return assignment
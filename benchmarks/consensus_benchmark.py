@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behaviors.consensus_algorithm import ConsensusAlgorithm
+from drone import Drone
+
+def run_consensus(num_drones, mode, epsilon, tolerance, max_steps, seed=0):
+    """
+    Runs the consensus algorithm alone until the swarm has contracted around its centroid.
+
+    Parameters:
+    - num_drones (int): Number of drones in the swarm.
+    - mode (str): Consensus mode ('flat' or 'hierarchical').
+    - epsilon (float): Convergence rate of the consensus algorithm.
+    - tolerance (float): Fraction of the initial spread at which consensus is reached.
+    - max_steps (int): Maximum number of steps to run.
+    - seed (int): Seed of the initial positions.
+
+    Returns:
+    - steps (int): Number of steps needed to reach consensus.
+    - step_time (float): Mean duration of a step, in seconds.
+    - messages (float): Mean number of messages exchanged per step.
+    """
+    rng = np.random.default_rng(seed)
+    drones = [Drone(position, i) for i, position in enumerate(rng.random((num_drones, 3)) * 100)]
+    algorithm = ConsensusAlgorithm(epsilon, mode=mode)
+
+    positions = np.array([drone.get_position() for drone in drones])
+    initial_spread = np.linalg.norm(positions - positions.mean(axis=0), axis=1).max()
+
+    elapsed = 0.0
+    messages = 0
+    for step in range(1, max_steps + 1):
+        start = time.perf_counter()
+        algorithm.prepare(drones)
+        for row, drone in enumerate(drones):
+            # Flat consensus needs the positions of all the other drones
+            neighbor_positions = np.delete(positions, row, axis=0) if mode == "flat" else None
+            drone.position = algorithm.apply(drone, neighbor_positions, drone.position.copy())
+            positions[row] = drone.position
+        elapsed += time.perf_counter() - start
+        messages += algorithm.message_count if mode == "hierarchical" else num_drones * (num_drones - 1)
+
+        spread = np.linalg.norm(positions - positions.mean(axis=0), axis=1).max()
+        if spread <= tolerance * initial_spread:
+            break
+
+    return step, elapsed / step, messages / step
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare flat and hierarchical consensus.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--flat-limit", type=int, default=2000, help="Largest swarm run in flat mode (O(N^2) per step)")
+    parser.add_argument("--epsilon", type=float, default=0.1)
+    parser.add_argument("--tolerance", type=float, default=0.01)
+    parser.add_argument("--max-steps", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'drones':>8} {'mode':>13} {'steps':>6} {'ms/step':>10} {'messages/step':>14}")
+    for num_drones in args.sizes:
+        for mode in ("flat", "hierarchical"):
+            if mode == "flat" and num_drones > args.flat_limit:
+                print(f"{num_drones:>8} {mode:>13} {'skipped':>6}")
+                continue
+            steps, step_time, messages = run_consensus(num_drones, mode, args.epsilon, args.tolerance, args.max_steps)
+            print(f"{num_drones:>8} {mode:>13} {steps:>6} {step_time * 1000:>10.1f} {messages:>14.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import json
+
+from telemetry import TelemetryDecoder, REPLY, read_message
+
+class ControlClient:
+    """
+    Minimal client for ControlServer, standing in for the ground-control software.
+    """
+
+    def __init__(self, reader, writer):
+        """
+        Initializes the client on an open connection.
+
+        Parameters:
+        - reader (asyncio.StreamReader): Incoming replies and telemetry.
+        - writer (asyncio.StreamWriter): Outgoing commands.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.decoder = TelemetryDecoder()
+        self.bytes_received = 0
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=8765, path=None):
+        """
+        Connects to a control server over TCP, or over a Unix socket when a path is given.
+
+        Returns:
+        - client (ControlClient): The connected client.
+        """
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def send(self, command, value=None):
+        """
+        Sends a command without waiting for its reply.
+
+        Parameters:
+        - command (str): Command name ('formation', 'change_x_position', 'start', 'stop', 'subscribe', ...).
+        - value: Optional command argument.
+        """
+        self.writer.write(json.dumps({"command": command, "value": value}).encode() + b"\n")
+        await self.writer.drain()
+
+    async def receive(self):
+        """
+        Receives the next message from the server.
+
+        Returns:
+        - kind (str): 'reply' or 'telemetry'.
+        - data: The reply dictionary, or the decoded drone positions.
+        """
+        message_type, body = await read_message(self.reader)
+        self.bytes_received += len(body)
+        if message_type == REPLY:
+            return "reply", json.loads(body)
+        return "telemetry", self.decoder.decode(message_type, body)
+
+    async def request(self, command, value=None):
+        """
+        Sends a command and waits for its reply, decoding any telemetry received meanwhile.
+
+        Returns:
+        - reply (dict): The server reply.
+        """
+        await self.send(command, value)
+        while True:
+            kind, data = await self.receive()
+            if kind == "reply":
+                return data
+
+    async def close(self):
+        """
+        Closes the connection.
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+
+async def run(args):
+    client = await ControlClient.connect(args.host, args.port, args.path)
+
+    if args.command != "subscribe":
+        print(await client.request(args.command, args.value))
+        await client.close()
+        return
+
+    print(await client.request("subscribe", args.value))
+    frames = 0
+    while frames < args.frames:
+        kind, data = await client.receive()
+        if kind == "telemetry":
+            frames += 1
+            print(f"frame {client.decoder.sequence}: {len(data)} drones, "
+                  f"centroid {data.mean(axis=0).round(2)}, {client.bytes_received} bytes received")
+    await client.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Send commands to the drone swarm simulation or watch its telemetry.")
+    parser.add_argument("command", help="formation, change_x_position, start, stop or subscribe")
+    parser.add_argument("value", nargs="?", help="Command argument (formation type, telemetry rate)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", help="Unix socket path, used instead of TCP")
+    parser.add_argument("--frames", type=int, default=10, help="Number of telemetry frames to receive")
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import argparse
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from behaviors.consensus_algorithm import ConsensusAlgorithm
+from behaviors.collision_avoidance_algorithm import CollisionAvoidanceAlgorithm
+from behaviors.formation_control_algorithm import FormationControlAlgorithm
+from simulation import step_swarm
+from drone import Drone
+
+def record_run(drones, behavior_algorithms, num_frames):
+    """
+    Runs the simulation headlessly and records the swarm state at every step.
+
+    Parameters:
+    - drones (list of Drone): List of drone objects in the swarm.
+    - behavior_algorithms (list): List of behavior algorithms to apply.
+    - num_frames (int): Number of simulation steps to record.
+
+    Returns:
+    - positions (numpy array): Drone positions for each frame, shape (frames, N, 3).
+    - target_positions (numpy array): Drone target positions for each frame, shape (frames, N, 3).
+    """
+    positions = np.empty((num_frames, len(drones), 3))
+    target_positions = np.empty((num_frames, len(drones), 3))
+
+    for frame in range(num_frames):
+        step_swarm(drones, behavior_algorithms)
+        positions[frame] = [drone.get_position() for drone in drones]
+        target_positions[frame] = [drone.target_position for drone in drones]
+
+    return positions, target_positions
+
+def save_recording(path, positions, target_positions):
+    """
+    Saves a recorded run to a .npz file.
+
+    Parameters:
+    - path (str): Destination file.
+    - positions (numpy array): Drone positions for each frame.
+    - target_positions (numpy array): Drone target positions for each frame.
+    """
+    np.savez_compressed(path, positions=positions, target_positions=target_positions)
+
+def load_recording(path):
+    """
+    Loads a run saved with save_recording().
+
+    Parameters:
+    - path (str): Recording file.
+
+    Returns:
+    - positions (numpy array): Drone positions for each frame.
+    - target_positions (numpy array): Drone target positions for each frame.
+    """
+    with np.load(path) as recording:
+        return recording['positions'], recording['target_positions']
+
+def _render_frames(job):
+    """
+    Renders a contiguous range of frames to PNG files. Runs in a worker process.
+
+    Parameters:
+    - job (tuple): (first frame index, positions, target positions, settings).
+
+    Returns:
+    - paths (list of str): Paths of the written frames.
+    """
+    start, positions, target_positions, settings = job
+
+    # The Agg backend renders without a display, it must be selected before any figure exists
+    import matplotlib
+    matplotlib.use('Agg')
+    from visualizer import DroneSwarmVisualizer
+
+    drones = [Drone(position, i) for i, position in enumerate(positions[0])]
+    visualizer = DroneSwarmVisualizer(
+        drones,
+        settings['formation_type'],
+        lod_threshold=settings['lod_threshold'],
+        lod_mode=settings['lod_mode']
+    )
+    visualizer.color_mode = settings['color_mode']
+    visualizer.fig.set_size_inches(*settings['size'])
+
+    paths = []
+    for offset, (frame_positions, frame_targets) in enumerate(zip(positions, target_positions)):
+        for drone, position, target in zip(drones, frame_positions, frame_targets):
+            drone.position = position
+            drone.target_position = target
+
+        if settings['follow_swarm']:
+            visualizer.update_view(drones)
+        else:
+            visualizer.update_zoom(settings['zoom_level'])
+        visualizer.animate(start + offset)
+
+        path = os.path.join(settings['output_dir'], settings['pattern'] % (start + offset))
+        visualizer.fig.savefig(path, dpi=settings['dpi'])
+        paths.append(path)
+
+    return paths
+
+class FrameExporter:
+    """
+    Renders recorded swarm runs offscreen to numbered PNG files using a process pool,
+    and optionally encodes them to a video with a local ffmpeg.
+    """
+
+    def __init__(self, output_dir, formation_type="line", color_mode="by_index", zoom_level=10.0,
+                 follow_swarm=True, size=(6.4, 4.8), dpi=100, lod_threshold=2000, lod_mode='subsample',
+                 workers=None):
+        """
+        Initializes the exporter.
+
+        Parameters:
+        - output_dir (str): Directory where the frames are written.
+        - formation_type (str): Formation type passed to the visualizer.
+        - color_mode (str): Color mode of the drones ('by_index' or 'by_distance').
+        - zoom_level (float): Fixed zoom level, used when follow_swarm is False.
+        - follow_swarm (bool): Whether the view follows the drones as in the GUI.
+        - size (tuple): Figure size in inches.
+        - dpi (int): Resolution of the written frames.
+        - lod_threshold (int): Level of detail threshold passed to the visualizer.
+        - lod_mode (str): Level of detail mode passed to the visualizer.
+        - workers (int): Number of worker processes, defaults to the number of cores.
+        """
+        self.output_dir = output_dir
+        self.pattern = "frame_%05d.png"
+        self.workers = workers or os.cpu_count() or 1
+        self.settings = {
+            'output_dir': output_dir,
+            'pattern': self.pattern,
+            'formation_type': formation_type,
+            'color_mode': color_mode,
+            'zoom_level': zoom_level,
+            'follow_swarm': follow_swarm,
+            'size': size,
+            'dpi': dpi,
+            'lod_threshold': lod_threshold,
+            'lod_mode': lod_mode,
+        }
+
+    def export(self, positions, target_positions=None, chunks_per_worker=4):
+        """
+        Renders every frame of a run to a PNG file.
+
+        Parameters:
+        - positions (numpy array): Drone positions for each frame, shape (frames, N, 3).
+        - target_positions (numpy array): Drone target positions for each frame, defaults to the positions.
+        - chunks_per_worker (int): Number of frame ranges given to each worker, for load balancing.
+
+        Returns:
+        - paths (list of str): Paths of the written frames, in frame order.
+        """
+        positions = np.asarray(positions, dtype=float)
+        target_positions = positions if target_positions is None else np.asarray(target_positions, dtype=float)
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Split the run into contiguous frame ranges, each rendered by a single figure
+        num_chunks = min(len(positions), self.workers * chunks_per_worker)
+        bounds = np.linspace(0, len(positions), num_chunks + 1).astype(int)
+        jobs = [(start, positions[start:end], target_positions[start:end], self.settings)
+                for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+
+        if self.workers == 1:
+            results = map(_render_frames, jobs)
+            return [path for paths in results for path in paths]
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return [path for paths in executor.map(_render_frames, jobs) for path in paths]
+
+    def encode(self, output_file, fps=25):
+        """
+        Encodes the exported frames to a video with ffmpeg, if it is installed.
+
+        Parameters:
+        - output_file (str): Destination video file.
+        - fps (int): Frame rate of the video.
+
+        Returns:
+        - output_file (str or None): The video file, or None if no encoder is available.
+        """
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            return None
+
+        subprocess.run([
+            ffmpeg, "-y", "-loglevel", "error",
+            "-framerate", str(fps),
+            "-i", os.path.join(self.output_dir, self.pattern),
+            # yuv420p needs even dimensions
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-pix_fmt", "yuv420p",
+            output_file
+        ], check=True)
+
+        return output_file
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a drone swarm run offscreen to PNG frames or a video.")
+    parser.add_argument("output_dir", help="Directory where the frames are written")
+    parser.add_argument("--recording", help="Recorded run (.npz) to render instead of simulating a new one")
+    parser.add_argument("--save-recording", help="Save the simulated run to this .npz file")
+    parser.add_argument("--drones", type=int, default=100, help="Number of drones to simulate")
+    parser.add_argument("--frames", type=int, default=100, help="Number of frames to simulate")
+    parser.add_argument("--formation", default="line", choices=["line", "circle", "square", "random"])
+    parser.add_argument("--color-mode", default="by_index", choices=["by_index", "by_distance"])
+    parser.add_argument("--workers", type=int, help="Number of worker processes")
+    parser.add_argument("--video", help="Encode the frames to this video file if ffmpeg is available")
+    parser.add_argument("--fps", type=int, default=25)
+    args = parser.parse_args()
+
+    if args.recording:
+        positions, target_positions = load_recording(args.recording)
+    else:
+        # Same parameters as the GUI simulation
+        formation_algorithm = FormationControlAlgorithm(args.formation)
+        behavior_algorithms = [
+            ConsensusAlgorithm(0.1),
+            CollisionAvoidanceAlgorithm(1.0),
+            formation_algorithm
+        ]
+        drones = [Drone(np.random.rand(3) * 10, i) for i in range(args.drones)]
+        formation_algorithm.assign_slots(drones)
+        positions, target_positions = record_run(drones, behavior_algorithms, args.frames)
+        if args.save_recording:
+            save_recording(args.save_recording, positions, target_positions)
+
+    exporter = FrameExporter(args.output_dir, formation_type=args.formation, color_mode=args.color_mode,
+                             workers=args.workers)
+    paths = exporter.export(positions, target_positions)
+    print(f"Wrote {len(paths)} frames to {args.output_dir}")
+
+    if args.video:
+        if exporter.encode(args.video, fps=args.fps):
+            print(f"Encoded {args.video}")
+        else:
+            print("ffmpeg not found, skipping video encoding")
+
+if __name__ == "__main__":
+    main()
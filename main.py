@@ -8,6 +8,8 @@ from behaviors.consensus_algorithm import ConsensusAlgorithm
 from behaviors.collision_avoidance_algorithm import CollisionAvoidanceAlgorithm
 from behaviors.formation_control_algorithm import FormationControlAlgorithm
 from visualizer import DroneSwarmVisualizer
+from simulation import SwarmScheduler
+from server import ControlServer
 from drone import Drone
 
 class DroneSwarmApp:
@@ -25,8 +27,10 @@ class DroneSwarmApp:
         self.num_drones = 100  # Number of drones in the swarm
         self.iterations = 100  # Number of iterations (not currently used)
         self.epsilon = 0.1  # Parameter for the consensus algorithm
+        self.consensus_mode = "flat"  # Consensus mode ("flat" or "hierarchical" for very large swarms)
         self.collision_threshold = 1.0  # Minimum distance to avoid collisions
         self.interval = 200  # Time interval between simulation updates (ms)
+        self.control_port = 8765  # Port of the control and telemetry server
 
         # UI control variables
         self.formation_type = tk.StringVar(value="line")  # Formation type selection
@@ -34,7 +38,7 @@ class DroneSwarmApp:
 
         # Define behavior algorithms
         self.behavior_algorithms = [
-            ConsensusAlgorithm(self.epsilon),
+            ConsensusAlgorithm(self.epsilon, mode=self.consensus_mode),
             CollisionAvoidanceAlgorithm(self.collision_threshold),
             FormationControlAlgorithm(self.formation_type.get())
         ]
@@ -42,6 +46,9 @@ class DroneSwarmApp:
         # Initialize the swarm with 3D random positions
         self.drones = [Drone(np.random.rand(3) * 10, i) for i in range(self.num_drones)]
 
+        # Schedule drone updates, settled drones sleep until they are disturbed
+        self.scheduler = SwarmScheduler(self.drones, self.behavior_algorithms, self.collision_threshold)
+
         # Initialize the visualizer
         self.visualizer = DroneSwarmVisualizer(self.drones, self.formation_type.get())
 
@@ -51,6 +58,13 @@ class DroneSwarmApp:
         # Simulation state
         self.running = False
 
+        # Start the control and telemetry server
+        self.server = ControlServer(self.handle_command, port=self.control_port)
+        try:
+            self.server.start()
+        except OSError as error:
+            print(f"Control server disabled: {error}")
+
     def setup_ui(self):
         """
         Set up the graphical user interface.
@@ -106,6 +120,8 @@ class DroneSwarmApp:
         Update the formation control algorithm when the user selects a different formation.
         """
         self.behavior_algorithms[-1] = FormationControlAlgorithm(self.formation_type.get())
+        self.behavior_algorithms[-1].assign_slots(self.drones)
+        self.scheduler.wake_all()
         self.visualizer.formation_type = self.formation_type.get()
         self.canvas.draw()
 
@@ -148,26 +164,64 @@ class DroneSwarmApp:
         self.is_x_at_origin = not self.is_x_at_origin
         self.update_target_positions()
 
+    def handle_command(self, command, value):
+        """
+        Handle a command received by the control server. Called from the server thread,
+        so the command is validated immediately and executed later in the Tkinter thread.
+
+        Raises ValueError if the command is unknown or its value is invalid.
+        """
+        if command == "formation":
+            if value not in ("line", "circle", "square", "random"):
+                raise ValueError(f"Unknown formation: {value}")
+            self.root.after(0, self.select_formation, value)
+        elif command == "change_x_position":
+            self.root.after(0, self.change_x_position)
+        elif command in ("start", "stop"):
+            self.root.after(0, self.set_running, command == "start")
+        else:
+            raise ValueError(f"Unknown command: {command}")
+
+    def select_formation(self, formation_type):
+        """
+        Select a formation as if the user had clicked its radio button.
+        """
+        self.formation_type.set(formation_type)
+        self.update_formation()
+
+    def set_running(self, running):
+        """
+        Start or stop the simulation if it is not already in the requested state.
+        """
+        if running != self.running:
+            self.toggle_simulation()
+
     def update_target_positions(self):
         """
         Update the target positions of the drones based on the current formation.
         """
-        formation = self.behavior_algorithms[-1].get_formation(self.drones)
-        for drone, target in zip(self.drones, formation):
-            drone.target_position = self.target_point + target
+        formation_algorithm = self.behavior_algorithms[-1]
+
+        # Update the target point in the formation control algorithm and reassign slots
+        formation_algorithm.set_target_point(self.target_point)
+        formation_algorithm.assign_slots(self.drones)
 
-        # Update the target point in the formation control algorithm
-        self.behavior_algorithms[-1].set_target_point(self.target_point)
+        formation = formation_algorithm.get_formation(self.drones)
+        for drone in self.drones:
+            drone.target_position = self.target_point + formation[formation_algorithm.get_slot(drone)]
+
+        # The target changed, settled drones must move again
+        self.scheduler.wake_all()
 
     def run_simulation(self):
         """
         Run the simulation loop, updating drone positions and refreshing the visualization.
         """
         while self.running:
-            # Update each drone's position based on behavior algorithms
-            for drone in self.drones:
-                neighbor_positions = [other_drone.communicate() for other_drone in self.drones if other_drone != drone]
-                drone.update_position(neighbor_positions, self.behavior_algorithms)
+            self.scheduler.step()
+
+            # Stream the new state to telemetry subscribers
+            self.server.publish([drone.get_position() for drone in self.drones])
 
             # Update the view to follow the drones
             self.visualizer.update_view(self.drones)
@@ -0,0 +1,189 @@
+import asyncio
+import json
+import threading
+
+import numpy as np
+
+from telemetry import TelemetryEncoder, REPLY, frame_message
+
+class ControlServer:
+    """
+    Asyncio server that accepts control commands and streams swarm telemetry to subscribers.
+
+    Clients send newline-delimited JSON commands such as {"command": "formation", "value": "circle"}.
+    Sending {"command": "subscribe", "value": <rate in Hz>} starts the telemetry stream.
+    The server runs its own event loop in a background thread. The simulation only hands it
+    the latest positions: each subscriber sends the newest state at its own bounded rate and
+    skips the frames it was too slow to send, so a slow client never stalls the simulation.
+    """
+
+    def __init__(self, command_handler, host="127.0.0.1", port=8765, path=None, max_rate=10.0, quantum=0.01):
+        """
+        Initializes the control server.
+
+        Parameters:
+        - command_handler (callable): Called as command_handler(command, value) for control commands.
+                                      It raises ValueError to reject a command.
+        - host (str): Interface to listen on for TCP connections.
+        - port (int): TCP port to listen on.
+        - path (str): Unix socket path, used instead of TCP when given.
+        - max_rate (float): Maximum telemetry rate of a subscriber, in frames per second.
+        - quantum (float): Position resolution of the telemetry stream.
+        """
+        self.command_handler = command_handler
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_rate = max_rate
+        self.quantum = quantum
+
+        self.loop = None
+        self.thread = None
+        self._ready = threading.Event()
+        self._error = None
+        self._stopped = None
+        self._latest = None
+        self._frame_events = set()
+        self._writers = set()
+
+    def start(self):
+        """
+        Starts the server in a background thread and waits until it is listening.
+        Raises OSError if the socket cannot be opened.
+        """
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        """
+        Runs the event loop of the server thread.
+        """
+        try:
+            asyncio.run(self.serve())
+        except OSError as error:
+            self._error = error
+            self._ready.set()
+
+    def stop(self):
+        """
+        Stops the server and waits for its thread to finish.
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self._stopped.set)
+        if self.thread is not None:
+            self.thread.join()
+
+    async def serve(self):
+        """
+        Runs the server until stop() is called.
+        """
+        self.loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+
+        if self.path:
+            server = await asyncio.start_unix_server(self.handle_client, path=self.path)
+        else:
+            server = await asyncio.start_server(self.handle_client, self.host, self.port)
+            self.port = server.sockets[0].getsockname()[1]
+
+        self._ready.set()
+        async with server:
+            await self._stopped.wait()
+
+            # Close client connections so that the server can shut down
+            for writer in list(self._writers):
+                writer.close()
+
+    def publish(self, positions):
+        """
+        Publishes the latest swarm positions. Safe to call from the simulation thread, never blocks.
+
+        Parameters:
+        - positions (numpy array): Drone positions, shape (N, 3).
+        """
+        self._latest = np.array(positions, dtype=float)
+        if self.loop is not None and self._frame_events:
+            self.loop.call_soon_threadsafe(self._notify_subscribers)
+
+    def _notify_subscribers(self):
+        """
+        Wakes up every subscriber after a new frame was published.
+        """
+        for frame_event in self._frame_events:
+            frame_event.set()
+
+    async def handle_client(self, reader, writer):
+        """
+        Serves one client connection: executes its commands and manages its telemetry stream.
+
+        Parameters:
+        - reader (asyncio.StreamReader): Incoming command stream.
+        - writer (asyncio.StreamWriter): Outgoing replies and telemetry.
+        """
+        stream = None
+        self._writers.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    command, value = request["command"], request.get("value")
+
+                    if command == "subscribe":
+                        rate = min(float(value or self.max_rate), self.max_rate)
+                        if rate <= 0:
+                            raise ValueError("Telemetry rate must be positive")
+                        if stream is None:
+                            stream = asyncio.create_task(self.stream_telemetry(writer, rate))
+                    elif command == "unsubscribe":
+                        if stream is not None:
+                            stream.cancel()
+                            stream = None
+                    else:
+                        self.command_handler(command, value)
+
+                    reply = {"ok": True, "command": command}
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {"ok": False, "error": str(error)}
+
+                writer.write(frame_message(REPLY, json.dumps(reply).encode()))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if stream is not None:
+                stream.cancel()
+            self._writers.discard(writer)
+            writer.close()
+
+    async def stream_telemetry(self, writer, rate):
+        """
+        Sends the latest swarm state to one subscriber, at most `rate` times per second.
+
+        Parameters:
+        - writer (asyncio.StreamWriter): Subscriber connection.
+        - rate (float): Maximum number of frames per second.
+        """
+        encoder = TelemetryEncoder(self.quantum)
+        frame_event = asyncio.Event()
+        if self._latest is not None:
+            frame_event.set()
+        self._frame_events.add(frame_event)
+
+        try:
+            while True:
+                await frame_event.wait()
+                frame_event.clear()
+                next_frame = self.loop.time() + 1.0 / rate
+
+                # Frames published while this client was busy are skipped, only the newest is sent
+                writer.write(encoder.encode(self._latest))
+                await writer.drain()
+
+                await asyncio.sleep(max(0.0, next_frame - self.loop.time()))
+        except ConnectionError:
+            pass
+        finally:
+            self._frame_events.discard(frame_event)
@@ -0,0 +1,134 @@
+import heapq
+
+import numpy as np
+
+def prepare_algorithms(drones, behavior_algorithms):
+    """
+    Lets the algorithms that work on the whole swarm (e.g. hierarchical consensus)
+    aggregate it once before the drones of a step are updated.
+
+    Parameters:
+    - drones (list of Drone): List of drone objects in the swarm.
+    - behavior_algorithms (list): List of behavior algorithms to apply.
+    """
+    for algorithm in behavior_algorithms:
+        prepare = getattr(algorithm, "prepare", None)
+        if prepare is not None:
+            prepare(drones)
+
+def step_swarm(drones, behavior_algorithms):
+    """
+    Advances the swarm by one simulation step.
+
+    Parameters:
+    - drones (list of Drone): List of drone objects in the swarm.
+    - behavior_algorithms (list): List of behavior algorithms to apply.
+    """
+    prepare_algorithms(drones, behavior_algorithms)
+
+    # Update each drone's position based on behavior algorithms
+    for drone in drones:
+        neighbor_positions = [other_drone.communicate() for other_drone in drones if other_drone != drone]
+        drone.update_position(neighbor_positions, behavior_algorithms)
+
+class SwarmScheduler:
+    """
+    Event-driven scheduler that updates each drone at its own rate.
+
+    Drones are kept in a priority queue ordered by their next update time. A drone that
+    moves less than settle_distance during an update is put to sleep and leaves the queue
+    until its target changes or another drone enters its collision radius, so the cost of
+    a step is proportional to the number of active drones once a formation has settled.
+    """
+
+    def __init__(self, drones, behavior_algorithms, collision_threshold=1.0, settle_distance=0.01, period=1.0):
+        """
+        Initializes the scheduler with every drone awake.
+
+        Parameters:
+        - drones (list of Drone): List of drone objects in the swarm.
+        - behavior_algorithms (list): List of behavior algorithms to apply.
+        - collision_threshold (float): Distance under which a moving drone wakes a sleeping one.
+        - settle_distance (float): Displacement under which a drone is considered settled.
+        - period (float): Default time between two updates of a drone, in simulation ticks.
+        """
+        self.drones = drones
+        self.behavior_algorithms = behavior_algorithms
+        self.collision_threshold = collision_threshold
+        self.settle_distance = settle_distance
+        self.time = 0.0
+
+        self.periods = np.full(len(drones), float(period))
+        self.positions = np.array([drone.get_position() for drone in drones], dtype=float)
+        self.asleep = np.zeros(len(drones), dtype=bool)
+        self.queue = [(self.time, i) for i in range(len(drones))]
+        heapq.heapify(self.queue)
+
+    def set_period(self, drone_indices, period):
+        """
+        Sets the update period of a drone or a group of drones. It applies from their next update.
+
+        Parameters:
+        - drone_indices (int or list of int): Positions of the drones in the swarm list.
+        - period (float): Time between two updates, in simulation ticks.
+        """
+        self.periods[drone_indices] = period
+
+    def wake(self, drone_indices):
+        """
+        Wakes sleeping drones so that they are updated at the current time.
+
+        Parameters:
+        - drone_indices (array-like of int): Positions of the drones in the swarm list.
+        """
+        for i in drone_indices:
+            if self.asleep[i]:
+                self.asleep[i] = False
+                heapq.heappush(self.queue, (self.time, i))
+
+    def wake_all(self):
+        """
+        Wakes every sleeping drone, e.g. after the formation or the target point changed.
+        """
+        self.wake(np.flatnonzero(self.asleep))
+
+    def step(self, dt=1.0):
+        """
+        Updates every drone whose update time falls before the end of the step, then advances the clock.
+
+        Parameters:
+        - dt (float): Time to advance, in simulation ticks.
+
+        Returns:
+        - updated (int): Number of drone updates performed.
+        """
+        end_time = self.time + dt
+        updated = 0
+
+        if self.queue and self.queue[0][0] < end_time:
+            prepare_algorithms(self.drones, self.behavior_algorithms)
+
+        while self.queue and self.queue[0][0] < end_time:
+            update_time, i = heapq.heappop(self.queue)
+            drone = self.drones[i]
+
+            neighbor_positions = [other_drone.communicate() for other_drone in self.drones if other_drone != drone]
+            drone.update_position(neighbor_positions, self.behavior_algorithms)
+            updated += 1
+
+            displacement = np.linalg.norm(drone.get_position() - self.positions[i])
+            self.positions[i] = drone.get_position()
+
+            if displacement < self.settle_distance:
+                self.asleep[i] = True
+                continue
+
+            heapq.heappush(self.queue, (update_time + self.periods[i], i))
+
+            # Wake the sleeping drones this drone moved close to
+            if self.asleep.any():
+                distances = np.linalg.norm(self.positions - self.positions[i], axis=1)
+                self.wake(np.flatnonzero(self.asleep & (distances < self.collision_threshold)))
+
+        self.time = end_time
+        return updated
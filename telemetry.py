@@ -0,0 +1,132 @@
+import struct
+import zlib
+
+import numpy as np
+
+# Every message is prefixed by its length and a one-byte type
+MESSAGE_HEADER = struct.Struct('<Ic')
+KEY_FRAME = b'K'
+DELTA_FRAME = b'D'
+REPLY = b'R'
+
+# Telemetry frames start with the sequence number, the number of drones and the quantum
+FRAME_HEADER = struct.Struct('<IIf')
+DELTA_TYPES = {1: np.int8, 2: np.int16}
+
+class TelemetryEncoder:
+    """
+    Encodes swarm positions into compact binary telemetry frames for one subscriber.
+
+    Positions are quantized on a fixed grid. Key frames carry absolute int32 coordinates,
+    delta frames carry the int8/int16 difference with the previous frame sent to the same
+    subscriber. Both are zlib-compressed, so drones that do not move cost almost nothing.
+    """
+
+    def __init__(self, quantum=0.01, key_frame_interval=50):
+        """
+        Initializes the encoder.
+
+        Parameters:
+        - quantum (float): Position resolution of the stream, in simulation units.
+        - key_frame_interval (int): Maximum number of delta frames between two key frames.
+        """
+        self.quantum = quantum
+        self.key_frame_interval = key_frame_interval
+        self.sequence = 0
+        self.previous = None
+        self.frames_since_key = 0
+
+    def encode(self, positions):
+        """
+        Encodes the current positions as a key or delta frame.
+
+        Parameters:
+        - positions (numpy array): Drone positions, shape (N, 3).
+
+        Returns:
+        - message (bytes): Framed telemetry message.
+        """
+        quantized = np.round(np.asarray(positions, dtype=float) / self.quantum).astype(np.int32)
+        header = FRAME_HEADER.pack(self.sequence, len(quantized), self.quantum)
+        self.sequence += 1
+
+        if (self.previous is not None and self.previous.shape == quantized.shape
+                and self.frames_since_key < self.key_frame_interval):
+            delta = quantized - self.previous
+            largest = np.abs(delta).max(initial=0)
+            width = 1 if largest <= np.iinfo(np.int8).max else 2 if largest <= np.iinfo(np.int16).max else None
+            if width is not None:
+                self.previous = quantized
+                self.frames_since_key += 1
+                payload = bytes([width]) + zlib.compress(delta.astype(DELTA_TYPES[width]).tobytes(), 1)
+                return frame_message(DELTA_FRAME, header + payload)
+
+        self.previous = quantized
+        self.frames_since_key = 0
+        return frame_message(KEY_FRAME, header + zlib.compress(quantized.tobytes(), 1))
+
+class TelemetryDecoder:
+    """
+    Rebuilds swarm positions from the telemetry frames produced by TelemetryEncoder.
+    """
+
+    def __init__(self):
+        """
+        Initializes the decoder.
+        """
+        self.current = None
+        self.sequence = None
+
+    def decode(self, message_type, body):
+        """
+        Decodes a telemetry frame.
+
+        Parameters:
+        - message_type (bytes): KEY_FRAME or DELTA_FRAME.
+        - body (bytes): Message body, without the length and type prefix.
+
+        Returns:
+        - positions (numpy array): Drone positions, shape (N, 3).
+        """
+        sequence, num_drones, quantum = FRAME_HEADER.unpack_from(body)
+        payload = body[FRAME_HEADER.size:]
+
+        if message_type == KEY_FRAME:
+            self.current = np.frombuffer(zlib.decompress(payload), dtype=np.int32).reshape(num_drones, 3)
+        elif message_type == DELTA_FRAME:
+            if self.current is None:
+                raise ValueError("Delta frame received before any key frame")
+            delta = np.frombuffer(zlib.decompress(payload[1:]), dtype=DELTA_TYPES[payload[0]])
+            self.current = self.current + delta.reshape(num_drones, 3)
+        else:
+            raise ValueError(f"Unknown telemetry frame type: {message_type!r}")
+
+        self.sequence = sequence
+        return self.current * quantum
+
+def frame_message(message_type, body):
+    """
+    Prefixes a message body with its length and type.
+
+    Parameters:
+    - message_type (bytes): One-byte message type.
+    - body (bytes): Message body.
+
+    Returns:
+    - message (bytes): Framed message.
+    """
+    return MESSAGE_HEADER.pack(len(body), message_type) + body
+
+async def read_message(reader):
+    """
+    Reads one framed message from an asyncio stream.
+
+    Parameters:
+    - reader (asyncio.StreamReader): Stream to read from.
+
+    Returns:
+    - message_type (bytes): One-byte message type.
+    - body (bytes): Message body.
+    """
+    length, message_type = MESSAGE_HEADER.unpack(await reader.readexactly(MESSAGE_HEADER.size))
+    return message_type, await reader.readexactly(length)
@@ -9,12 +9,16 @@ class DroneSwarmVisualizer:
     It updates their positions dynamically during the simulation.
     """
 
-    def __init__(self, drones, formation_type):
+    def __init__(self, drones, formation_type, lod_threshold=2000, lod_mode='subsample', voxel_resolution=12):
         """
         Initializes the visualizer with a list of drones.
 
         Parameters:
         - drones (list): List of Drone objects to be visualized.
+        - formation_type (str): The current formation type.
+        - lod_threshold (int): Maximum number of visible drones drawn individually.
+        - lod_mode (str): Level of detail used above the threshold ('subsample' or 'voxel').
+        - voxel_resolution (int): Number of voxels per axis in 'voxel' mode.
         """
         self.drones = drones
         self.formation_type = formation_type
@@ -23,6 +27,13 @@ class DroneSwarmVisualizer:
         self.customize_axes()  # Customize the appearance of the axes
         self.color_mode = 'fixed'
 
+        # Level of detail settings
+        self.lod_threshold = lod_threshold
+        self.lod_mode = lod_mode
+        self.voxel_resolution = voxel_resolution
+        self.point_size = plt.rcParams['lines.markersize'] ** 2
+        self.lod_priorities = None
+
         # Generate colors for the drones using a colormap
         colormap = cm.hsv
         self.colors = colormap(np.linspace(0, 1, len(drones)))
@@ -79,7 +90,7 @@ class DroneSwarmVisualizer:
         elif self.color_mode == 'by_distance':
             self.colors = self.calculate_colors_by_distance()
 
-        self.scat.set_color(self.colors)
+        self.draw_level_of_detail()
 
     def calculate_colors_by_distance(self):
         """
@@ -88,6 +99,21 @@ class DroneSwarmVisualizer:
         Returns:
         - colors (array): Array of colors corresponding to each drone.
         """
+        values, colormap = self.calculate_color_values()
+        return colormap(values)
+
+    def calculate_color_values(self):
+        """
+        Calculates the normalized color value of each drone and the colormap to apply,
+        so that aggregated drones can be colored with the same mode as individual ones.
+
+        Returns:
+        - values (array): Normalized color value of each drone, between 0 and 1.
+        - colormap (Colormap): Colormap used by the current color mode.
+        """
+        if self.color_mode != 'by_distance':
+            return np.linspace(0, 1, len(self.drones)), cm.hsv
+
         # Calculate distances from target positions
         distances = [np.linalg.norm(drone.get_position() - drone.target_position) for drone in self.drones]
 
@@ -97,7 +123,96 @@ class DroneSwarmVisualizer:
         # Create a custom colormap from green to red
         custom_cmap = LinearSegmentedColormap.from_list('green_red', ['green', 'yellow', 'red'])
 
-        return custom_cmap(norm(distances))
+        return np.asarray(norm(distances)), custom_cmap
+
+    def draw_level_of_detail(self):
+        """
+        Draws the drones that are inside the current view. When more than lod_threshold drones
+        are visible, only a stable subsample or a voxel aggregate of them is drawn.
+        """
+        positions = np.array([drone.get_position() for drone in self.drones])
+        visible = self.get_visible_mask(positions)
+
+        if np.count_nonzero(visible) <= self.lod_threshold:
+            # Small swarm or zoomed in: full detail
+            indices = np.flatnonzero(visible)
+            points, colors = positions[indices], self.colors[indices]
+            sizes = np.full(len(indices), self.point_size)
+        elif self.lod_mode == 'voxel':
+            points, colors, sizes = self.aggregate_voxels(positions[visible], visible)
+        else:
+            indices = self.select_subsample(visible)
+            points, colors = positions[indices], self.colors[indices]
+            sizes = np.full(len(indices), self.point_size)
+
+        self.scat._offsets3d = (points[:, 0], points[:, 1], points[:, 2])
+        self.scat.set_sizes(sizes)
+        self.scat.set_color(colors)
+
+    def get_visible_mask(self, positions):
+        """
+        Determines which drones lie inside the current axis limits.
+
+        Parameters:
+        - positions (numpy array): Positions of all drones.
+
+        Returns:
+        - visible (numpy array): Boolean mask of the visible drones.
+        """
+        limits = np.array([self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_zlim()])
+        return np.all((positions >= limits[:, 0]) & (positions <= limits[:, 1]), axis=1)
+
+    def select_subsample(self, visible):
+        """
+        Selects at most lod_threshold visible drones. Each drone has a fixed random priority,
+        so the same drones stay on screen from one frame to the next.
+
+        Parameters:
+        - visible (numpy array): Boolean mask of the visible drones.
+
+        Returns:
+        - indices (numpy array): Indices of the drones to draw.
+        """
+        if self.lod_priorities is None or len(self.lod_priorities) != len(self.drones):
+            self.lod_priorities = np.random.default_rng(0).permutation(len(self.drones))
+
+        indices = np.flatnonzero(visible)
+        keep = np.argpartition(self.lod_priorities[indices], self.lod_threshold - 1)[:self.lod_threshold]
+        return np.sort(indices[keep])
+
+    def aggregate_voxels(self, positions, visible):
+        """
+        Aggregates the visible drones into a voxel grid spanning the current view.
+        Each occupied voxel is drawn at the centroid of its drones, sized by their count
+        and colored by their mean color value.
+
+        Parameters:
+        - positions (numpy array): Positions of the visible drones.
+        - visible (numpy array): Boolean mask of the visible drones.
+
+        Returns:
+        - points (numpy array): Centroid of each occupied voxel.
+        - colors (array): Color of each occupied voxel.
+        - sizes (numpy array): Marker size of each occupied voxel.
+        """
+        values, colormap = self.calculate_color_values()
+        values = values[visible]
+
+        limits = np.array([self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_zlim()])
+        extent = np.maximum(limits[:, 1] - limits[:, 0], 1e-9)
+        cells = ((positions - limits[:, 0]) / extent * self.voxel_resolution).astype(int)
+        cells = np.clip(cells, 0, self.voxel_resolution - 1)
+        keys = (cells[:, 0] * self.voxel_resolution + cells[:, 1]) * self.voxel_resolution + cells[:, 2]
+
+        _, voxel_of_drone, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        points = np.column_stack([np.bincount(voxel_of_drone, weights=positions[:, axis]) for axis in range(3)])
+        points /= counts[:, None]
+        mean_values = np.bincount(voxel_of_drone, weights=values) / counts
+
+        # Marker area grows with the square root of the count to keep dense voxels readable
+        sizes = self.point_size * np.sqrt(counts)
+
+        return points, colormap(mean_values), sizes
 
     def animate(self, frame):
         """
@@ -109,8 +224,6 @@ class DroneSwarmVisualizer:
         Returns:
         - self.scat (scatter plot object): Updated scatter plot with new positions.
         """
-        positions = np.array([drone.get_position() for drone in self.drones])
-        self.scat._offsets3d = (positions[:, 0], positions[:, 1], positions[:, 2])
         self.update_colors()
         return self.scat,
 